@@ -1,15 +1,22 @@
 import os
-import json
+import asyncio
+import calendar
 import uuid
 import re
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple, Dict
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Header, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import Response
 from pydantic import BaseModel
+import orjson
+import aiofiles
 import pytesseract
 from PIL import Image
 import dateparser
@@ -21,6 +28,12 @@ try:
 except ImportError:
     _NUMPY = False
 
+# Linear-time (DFA) regex engine for the poster date scan
+try:
+    import re2 as _re_fast
+except ImportError:
+    _re_fast = re
+
 load_dotenv()
 
 # --- Tesseract path (required on Windows) ---
@@ -33,26 +46,67 @@ _user_tessdata = Path.home() / ".tessdata"
 if _user_tessdata.exists():
     os.environ["TESSDATA_PREFIX"] = str(_user_tessdata)
 
+# Grid rows are OCR'd in parallel; single-threaded tesseract per call beats
+# letting each call fan out over OpenMP threads that fight for the same cores
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# In-process tesseract bindings avoid a subprocess + model reload per call
+try:
+    import tesserocr
+    _TESSEROCR = True
+except ImportError:
+    _TESSEROCR = False
+
+# Each grid upload submits its 2 row bands; 4 workers let two uploads OCR at
+# once without idle threads each holding a loaded tesserocr model
+_OCR_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")
 EVENTS_FILE = Path("events.json")
 UPLOADS_DIR = Path("uploads")
 UPLOADS_DIR.mkdir(exist_ok=True)
+_UPLOAD_CHUNK = 64 * 1024
 
 app = FastAPI(title="Science Calendar API")
 
 
 # --- Storage ---
 
-def load_events() -> List[dict]:
-    if EVENTS_FILE.exists():
-        return json.loads(EVENTS_FILE.read_text(encoding="utf-8"))
-    return []
+# Parsed events.json plus an id → list-index map, reused while the file is unchanged.
+# Cached objects are never mutated: writers build new ones under _EVENTS_LOCK
+# (held across load → modify → save) and save_events() installs them only
+# once the file is on disk.
+_EVENTS_CACHE = {"stamp": None, "data": None, "index": None}
+_EVENTS_LOCK = threading.RLock()
 
 
-def save_events(events: List[dict]):
-    EVENTS_FILE.write_text(
-        json.dumps(events, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+def _file_stamp(path: Path):
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def load_events() -> Tuple[List[dict], Dict[str, int]]:
+    with _EVENTS_LOCK:
+        if not EVENTS_FILE.exists():
+            return [], {}
+        stamp = _file_stamp(EVENTS_FILE)
+        if _EVENTS_CACHE["stamp"] != stamp:
+            events = orjson.loads(EVENTS_FILE.read_bytes())
+            _EVENTS_CACHE["data"] = events
+            _EVENTS_CACHE["index"] = {e["id"]: i for i, e in enumerate(events)}
+            _EVENTS_CACHE["stamp"] = stamp
+        return _EVENTS_CACHE["data"], _EVENTS_CACHE["index"]
+
+
+def save_events(events: List[dict], id_index: Dict[str, int]):
+    with _EVENTS_LOCK:
+        # Write-then-rename so readers never see a half-written file
+        tmp_path = EVENTS_FILE.with_name(EVENTS_FILE.name + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, EVENTS_FILE)
+        _EVENTS_CACHE["data"] = events
+        _EVENTS_CACHE["index"] = id_index
+        _EVENTS_CACHE["stamp"] = _file_stamp(EVENTS_FILE)
 
 
 # --- Auth ---
@@ -85,15 +139,17 @@ class EventUpdate(BaseModel):
 
 @app.get("/events")
 def get_events():
-    return load_events()
+    events, _ = load_events()
+    return events
 
 
 @app.get("/events/{event_id}/export")
 def export_ics(event_id: str):
-    events = load_events()
-    event = next((e for e in events if e["id"] == event_id), None)
-    if not event:
+    events, id_index = load_events()
+    i = id_index.get(event_id)
+    if i is None:
         raise HTTPException(status_code=404, detail="Evenimentul nu există")
+    event = events[i]
     return Response(
         content=_generate_ics(event),
         media_type="text/calendar",
@@ -122,13 +178,32 @@ async def upload_image(
 
     temp_path = UPLOADS_DIR / f"{uuid.uuid4()}{suffix}"
     try:
-        temp_path.write_bytes(await file.read())
-        image = Image.open(temp_path)
+        # Stream to disk in chunks instead of buffering the whole poster
+        async with aiofiles.open(temp_path, "wb", buffering=_UPLOAD_CHUNK) as out:
+            while chunk := await file.read(_UPLOAD_CHUNK):
+                await out.write(chunk)
+
+        # OCR is CPU-bound; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _process_image, temp_path, year)
+
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _process_image(path: Path, year: Optional[int]) -> dict:
+    with Image.open(path) as image:
         W, H = image.size
 
         # For landscape images (W > H), try grid calendar extraction first
         if _NUMPY and W > H:
-            events = _extract_calendar_grid(image, forced_year=year)
+            # One grayscale decode shared by title detection and grid OCR
+            gray = np.asarray(image.convert("L"))
+            layout = _grid_layout(gray)
+            events = []
+            # Clear-cut posters (no separators, no gutters) go straight to poster OCR
+            if not _looks_like_poster(gray, layout):
+                events = _extract_calendar_grid(gray, forced_year=year, layout=layout)
             if len(events) >= 10:
                 months_found = len(set(e["date"][:7] for e in events))
                 detected_year = events[0]["date"][:4]
@@ -140,48 +215,53 @@ async def upload_image(
                 return {"raw_text": summary, "events": events}
 
         # Simple poster: full-image OCR + date-pattern extraction
-        try:
-            text = pytesseract.image_to_string(image, lang="ron+eng")
-        except pytesseract.TesseractError:
-            text = pytesseract.image_to_string(image, lang="eng")
+        text = _ocr(image)
 
-        events = _extract_events(text)
-        return {"raw_text": text, "events": events}
-
-    finally:
-        temp_path.unlink(missing_ok=True)
+    events = _extract_events(text)
+    return {"raw_text": text, "events": events}
 
 
 @app.post("/admin/events")
 def create_event(event: Event, _: None = Depends(require_admin)):
-    events = load_events()
-    event.id = str(uuid.uuid4())
-    events.append(event.model_dump())
-    save_events(events)
-    return event
+    # FastAPI already validated the body; store its fields without a model_dump() pass
+    record = {**event.__dict__, "id": str(uuid.uuid4())}
+    with _EVENTS_LOCK:
+        events, id_index = load_events()
+        id_index = {**id_index, record["id"]: len(events)}
+        save_events(events + [record], id_index)
+    return record
 
 
 @app.put("/admin/events/{event_id}")
 def update_event(
     event_id: str, update: EventUpdate, _: None = Depends(require_admin)
 ):
-    events = load_events()
-    for i, e in enumerate(events):
-        if e["id"] == event_id:
-            for k, v in update.model_dump(exclude_none=True).items():
-                events[i][k] = v
-            save_events(events)
-            return events[i]
-    raise HTTPException(status_code=404, detail="Evenimentul nu există")
+    changes = {k: v for k, v in update.__dict__.items() if v is not None}
+    with _EVENTS_LOCK:
+        events, id_index = load_events()
+        i = id_index.get(event_id)
+        if i is None:
+            raise HTTPException(status_code=404, detail="Evenimentul nu există")
+        record = {**events[i], **changes}
+        events = list(events)
+        events[i] = record
+        save_events(events, id_index)
+    return record
 
 
 @app.delete("/admin/events/{event_id}")
 def delete_event(event_id: str, _: None = Depends(require_admin)):
-    events = load_events()
-    new_events = [e for e in events if e["id"] != event_id]
-    if len(new_events) == len(events):
-        raise HTTPException(status_code=404, detail="Evenimentul nu există")
-    save_events(new_events)
+    with _EVENTS_LOCK:
+        events, id_index = load_events()
+        i = id_index.get(event_id)
+        if i is None:
+            raise HTTPException(status_code=404, detail="Evenimentul nu există")
+        events = events[:i] + events[i + 1:]
+        id_index = dict(id_index)
+        del id_index[event_id]
+        for j in range(i, len(events)):
+            id_index[events[j]["id"]] = j
+        save_events(events, id_index)
     return {"ok": True}
 
 
@@ -189,37 +269,174 @@ def delete_event(event_id: str, _: None = Depends(require_admin)):
 app.mount("/", StaticFiles(directory="static", html=True), name="static")
 
 
+# ═══════════════════════════════════════════════════════════════
+# OCR — Tesseract backend
+# ═══════════════════════════════════════════════════════════════
+
+_tess_local = threading.local()
+
+
+def _tess_api() -> "tesserocr.PyTessBaseAPI":
+    """Long-lived tesseract session for the calling thread (models load once)."""
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        kwargs = {}
+        if os.getenv("TESSDATA_PREFIX"):
+            kwargs["path"] = os.environ["TESSDATA_PREFIX"]
+        try:
+            api = tesserocr.PyTessBaseAPI(lang="ron+eng", psm=tesserocr.PSM.AUTO, **kwargs)
+        except RuntimeError:
+            api = tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.AUTO, **kwargs)
+        _tess_local.api = api
+    return api
+
+
+def _ocr(image: Image.Image) -> str:
+    if _TESSEROCR:
+        api = _tess_api()
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    try:
+        return pytesseract.image_to_string(image, lang="ron+eng")
+    except pytesseract.TesseractError:
+        return pytesseract.image_to_string(image, lang="eng")
+
+
+def _ocr_words(image: Image.Image) -> List[Tuple[tuple, int, int, int, str]]:
+    """Word-level OCR: (line_key, left, top, width, text) per recognized word."""
+    words = []
+    if _TESSEROCR:
+        api = _tess_api()
+        api.SetImage(image)
+        api.Recognize()
+        ri = api.GetIterator()
+        if ri is None:
+            return words
+        level, line = tesserocr.RIL.WORD, -1
+        for r in tesserocr.iterate_level(ri, level):
+            if r.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line += 1
+            text = (r.GetUTF8Text(level) or "").strip()
+            box = r.BoundingBox(level)
+            if text and box:
+                x0, y0, x1, _ = box
+                words.append(((line,), x0, y0, x1 - x0, text))
+        return words
+
+    try:
+        data = pytesseract.image_to_data(
+            image, lang="ron+eng", output_type=pytesseract.Output.DICT
+        )
+    except pytesseract.TesseractError:
+        data = pytesseract.image_to_data(
+            image, lang="eng", output_type=pytesseract.Output.DICT
+        )
+    for i, text in enumerate(data["text"]):
+        text = text.strip()
+        if text:
+            key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            words.append((key, data["left"][i], data["top"][i], data["width"][i], text))
+    return words
+
+
 # ═══════════════════════════════════════════════════════════════
 # OCR — Simple poster (dates written in full, e.g. "15 martie 2025")
 # ═══════════════════════════════════════════════════════════════
 
+_MONTHS_RO  = ["Ianuarie","Februarie","Martie","Aprilie","Mai","Iunie",
+               "Iulie","August","Septembrie","Octombrie","Noiembrie","Decembrie"]
+_MONTHS_EN  = ["January","February","March","April","May","June",
+               "July","August","September","October","November","December"]
+_MONTHS_RO_LOWER = {m.lower(): i + 1 for i, m in enumerate(_MONTHS_RO)}
+_MONTHS_EN_LOWER = {m.lower(): i + 1 for i, m in enumerate(_MONTHS_EN)}
+
+# (name, pattern) — the name selects the matching fast parser below
 _DATE_PATTERNS = [
-    r"\b\d{1,2}[.\-/]\d{1,2}[.\-/]\d{2,4}\b",
-    r"\b\d{1,2}\s+(?:ianuarie|februarie|martie|aprilie|mai|iunie|iulie|august"
-    r"|septembrie|octombrie|noiembrie|decembrie)\s+\d{4}\b",
-    r"\b(?:january|february|march|april|may|june|july|august|september"
-    r"|october|november|december)\s+\d{1,2},?\s+\d{4}\b",
-    r"\b\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2}\b",
+    ("dmy_numeric", r"\b\d{1,2}[.\-/]\d{1,2}[.\-/]\d{2,4}\b"),
+    ("dmy_ro", r"\b\d{1,2}\s+(?:ianuarie|februarie|martie|aprilie|mai|iunie|iulie|august"
+               r"|septembrie|octombrie|noiembrie|decembrie)\s+\d{4}\b"),
+    ("mdy_en", r"\b(?:january|february|march|april|may|june|july|august|september"
+               r"|october|november|december)\s+\d{1,2},?\s+\d{4}\b"),
+    ("ymd_numeric", r"\b\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2}\b"),
 ]
-_DATE_RE = re.compile("|".join(_DATE_PATTERNS), re.IGNORECASE)
+# Inline (?i) rather than re.IGNORECASE: the re2 module takes no flags argument
+_DATE_RE = _re_fast.compile(
+    "(?i)" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in _DATE_PATTERNS)
+)
+_DATE_SEP = re.compile(r"[.\-/]")
+# Built once; dateparser.parse() would rebuild its language setup on every call
+_DATE_PARSER = dateparser.DateDataParser(languages=["ro", "en"])
+
+
+def _make_date(year: int, month: Optional[int], day: int) -> Optional[datetime]:
+    if month is None:
+        return None
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        return None
+
+
+def _parse_dmy_numeric(s: str) -> Optional[datetime]:
+    d, m, y = _DATE_SEP.split(s)
+    if len(y) == 2:
+        # Same pivot as strptime's %y
+        y = ("19" if int(y) >= 69 else "20") + y
+    elif len(y) != 4:
+        return None
+    return _make_date(int(y), int(m), int(d))
+
+
+def _parse_dmy_ro(s: str) -> Optional[datetime]:
+    d, m, y = s.split()
+    return _make_date(int(y), _MONTHS_RO_LOWER.get(m.lower()), int(d))
+
+
+def _parse_mdy_en(s: str) -> Optional[datetime]:
+    m, d, y = s.replace(",", " ").split()
+    return _make_date(int(y), _MONTHS_EN_LOWER.get(m.lower()), int(d))
+
+
+def _parse_ymd_numeric(s: str) -> Optional[datetime]:
+    y, m, d = _DATE_SEP.split(s)
+    return _make_date(int(y), int(m), int(d))
+
+
+_DATE_PARSERS = {
+    "dmy_numeric": _parse_dmy_numeric,
+    "dmy_ro": _parse_dmy_ro,
+    "mdy_en": _parse_mdy_en,
+    "ymd_numeric": _parse_ymd_numeric,
+}
+
+
+def _parse_date_match(match: re.Match) -> Optional[datetime]:
+    """Parse a _DATE_RE match with the parser for its format; dateparser as a last resort."""
+    parsed = _DATE_PARSERS[match.lastgroup](match.group())
+    if parsed is None:
+        parsed = _DATE_PARSER.get_date_data(match.group()).date_obj
+    return parsed
 
 
 def _extract_events(text: str) -> List[dict]:
     lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     events = []
 
+    # Scan each line once; the follow-up-line check below reuses the result
+    matches = [_DATE_RE.search(ln) for ln in lines]
+
     for i, line in enumerate(lines):
-        match = _DATE_RE.search(line)
+        match = matches[i]
         if not match:
             continue
 
-        parsed = dateparser.parse(match.group(), languages=["ro", "en"])
+        parsed = _parse_date_match(match)
         if not parsed:
             continue
 
         remainder = (line[: match.start()] + line[match.end():]).strip(" –—:-|")
         context = [remainder] if remainder else []
-        if i + 1 < len(lines) and not _DATE_RE.search(lines[i + 1]):
+        if i + 1 < len(lines) and not matches[i + 1]:
             context.append(lines[i + 1])
 
         title = " — ".join(p for p in context if p) or "Eveniment"
@@ -240,51 +457,103 @@ def _extract_events(text: str) -> List[dict]:
 # Format: "{day} {day_abbrev} {description} ({historical_year})"
 # ═══════════════════════════════════════════════════════════════
 
-_MONTHS_RO  = ["Ianuarie","Februarie","Martie","Aprilie","Mai","Iunie",
-               "Iulie","August","Septembrie","Octombrie","Noiembrie","Decembrie"]
 _DAY_LINE   = re.compile(r'^(\d{1,2})\s+[LMJVSDlji]{1,2}[\.\s]+(.*)')
 _HIST_YEAR  = re.compile(r'\((\d{4})\)\s*$')
+_WS_RE      = re.compile(r'\s+')
 _YEAR_IN_TITLE = re.compile(r'\b(20\d{2}|19\d{2})\b')
+_STANDALONE_YEAR_RE = re.compile(r'(?<!\d)(20\d{2})(?!\d)')
 
 
+@lru_cache(maxsize=256)
 def _days_in_month(month: int, year: int) -> int:
-    if month == 2:
-        return 29 if (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) else 28
-    return [31,28,31,30,31,30,31,31,30,31,30,31][month - 1]
+    return calendar.monthrange(year, month)[1]
 
 
-def _detect_year(image: Image.Image) -> int:
-    """Extract calendar year from the title area (top 10% of image)."""
-    W, H = image.size
-    title_crop = image.crop((0, 0, W, int(H * 0.10)))
-    title_crop = title_crop.resize((title_crop.width, title_crop.height * 2), Image.LANCZOS)
+def _detect_year(gray) -> int:
+    """Extract calendar year from the title area (top 10% of the grayscale image)."""
+    H = gray.shape[0]
+    title_crop = Image.fromarray(gray[: int(H * 0.10), :])
+    title_crop = title_crop.resize((title_crop.width, title_crop.height * 2), Image.BILINEAR)
     try:
-        text = pytesseract.image_to_string(title_crop, lang="ron+eng")
+        text = _ocr(title_crop)
     except Exception:
         text = ""
     # Look for a year that appears as a standalone token (surrounded by spaces/newlines)
-    standalone = re.findall(r'(?<!\d)(20\d{2})(?!\d)', text)
+    standalone = _STANDALONE_YEAR_RE.findall(text)
     candidates = [int(y) for y in standalone if 2024 <= int(y) <= 2035]
     if candidates:
         # Most frequent standalone year in the title area is the calendar year
-        from collections import Counter
-        return Counter(candidates).most_common(1)[0][0]
+        # (ties go to the first one seen)
+        return max(candidates, key=candidates.count)
     return datetime.now().year + 1
 
 
+def _smooth(profile, window: int):
+    """Moving average, same length and alignment as the input."""
+    # mode="same" returns max(len, window) samples; keep one per input column
+    return np.convolve(profile, np.ones(window) / window, mode="same")[:len(profile)]
+
+
+def _local_peaks(smoothed, min_dist: int, threshold: float):
+    """Indices x where smoothed[x] is the max of smoothed[x-min_dist:x+min_dist]."""
+    n = len(smoothed) - 2 * min_dist
+    if min_dist < 1 or n <= 0:
+        return np.empty(0, dtype=np.intp)
+    windows = np.lib.stride_tricks.sliding_window_view(smoothed, 2 * min_dist)[:n]
+    centre = smoothed[min_dist:min_dist + n]
+    mask = (centre == windows.max(axis=1)) & (centre > threshold)
+    return np.flatnonzero(mask) + min_dist
+
+
+def _otsu_threshold(arr) -> int:
+    """Global Otsu threshold of a uint8 grayscale array."""
+    hist = np.bincount(arr.ravel(), minlength=256).astype(np.float64)
+    w0 = np.cumsum(hist)
+    w1 = w0[-1] - w0
+    m0 = np.cumsum(hist * np.arange(256))
+    mu0 = m0 / np.maximum(w0, 1)
+    mu1 = (m0[-1] - m0) / np.maximum(w1, 1)
+    return int((w0 * w1 * (mu0 - mu1) ** 2).argmax())
+
+
 def _detect_col_separators(arr, y0: int, y1: int, W: int) -> List[int]:
     """Find x-positions of the 5 vertical separators between 6 month columns."""
     col_bright = arr[y0:y1, :].mean(axis=0)
-    window = 20
-    smoothed = np.convolve(col_bright, np.ones(window) / window, mode="same")
-    min_dist = W // 9
-    candidates = []
-    for x in range(min_dist, W - min_dist):
-        lo, hi = max(0, x - min_dist), x + min_dist
-        if smoothed[x] == smoothed[lo:hi].max() and smoothed[x] > 200:
-            candidates.append((x, float(smoothed[x])))
-    candidates.sort(key=lambda p: -p[1])
-    return sorted(p[0] for p in candidates[:5])
+    smoothed = _smooth(col_bright, 20)
+    peaks = _local_peaks(smoothed, W // 9, 200)
+    strongest = peaks[np.argsort(-smoothed[peaks], kind="stable")[:5]]
+    return sorted(int(x) for x in strongest)
+
+
+def _grid_layout(gray) -> List[Tuple[int, int, List[int]]]:
+    """(y0, y1, separators) for the top (months 1-6) and bottom (months 7-12) grid rows."""
+    H, W = gray.shape
+    # Detect horizontal separator between top row (months 1-6) and bottom row (7-12)
+    y_band = gray[int(H * 0.40): int(H * 0.60), int(W * 0.1): int(W * 0.9)]
+    mid_y = int(H * 0.40) + int(y_band.mean(axis=1).argmax()) if y_band.size else H // 2
+
+    rows = [
+        (int(H * 0.130), max(int(H * 0.130) + 10, mid_y - int(H * 0.015))),
+        (min(mid_y + int(H * 0.010), int(H * 0.95)), int(H * 0.900)),
+    ]
+    return [(y0, y1, _detect_col_separators(gray, y0, y1, W)) for y0, y1 in rows]
+
+
+def _looks_like_poster(gray, layout) -> bool:
+    """
+    Cheap precheck before grid OCR. True only when neither grid row yields the
+    5 separators in `layout` (from _grid_layout) *and* the column profile has
+    no sharp outlier columns (bright gutters or dark rule lines); anything less
+    clear-cut still gets the grid pass, including its equal-width fallback.
+    """
+    W = gray.shape[1]
+    if W < 24 or any(len(separators) == 5 for _, _, separators in layout):
+        # Too narrow for a meaningful column profile, or separators were found
+        return False
+    smoothed = _smooth(gray.mean(axis=0), 20)
+    deviation = np.abs(smoothed - np.median(smoothed))
+    threshold = deviation.mean() + 2 * deviation.std()
+    return len(_local_peaks(deviation, W // 24, threshold)) < 5
 
 
 def _parse_month_text(text: str, month_num: int, year: int) -> List[dict]:
@@ -298,10 +567,13 @@ def _parse_month_text(text: str, month_num: int, year: int) -> List[dict]:
         if current_day is None:
             return
         desc = " ".join(current_desc)
+        # _HIST_YEAR is end-anchored: cutting at the match equals sub("")
         yr_m = _HIST_YEAR.search(desc)
-        hist_yr = yr_m.group(1) if yr_m else ""
-        title = _HIST_YEAR.sub("", desc).strip(" ()–—")
-        title = re.sub(r"\s+", " ", title)[:140]
+        if yr_m:
+            hist_yr, desc = yr_m.group(1), desc[:yr_m.start()]
+        else:
+            hist_yr = ""
+        title = _WS_RE.sub(" ", desc.strip(" ()–—"))[:140]
         if len(title) >= 6:
             events.append({
                 "id": str(uuid.uuid4()),
@@ -329,29 +601,33 @@ def _parse_month_text(text: str, month_num: int, year: int) -> List[dict]:
     return events
 
 
-def _extract_calendar_grid(image: Image.Image, forced_year: Optional[int] = None) -> List[dict]:
+def _join_words(words) -> str:
+    """Rebuild text from (line_key, left, top, text) words: lines top-down, words left-right."""
+    lines: dict = {}
+    for key, left, top, text in words:
+        lines.setdefault(key, []).append((left, top, text))
+    ordered = sorted(lines.values(), key=lambda ws: min(top for _, top, _ in ws))
+    return "\n".join(" ".join(text for _, _, text in sorted(ws)) for ws in ordered)
+
+
+def _extract_calendar_grid(
+    gray, forced_year: Optional[int] = None, layout=None
+) -> List[dict]:
     """
     Extract events from a landscape annual calendar poster with a 6×2 month grid.
+    `gray` is the poster's grayscale array (H×W, uint8); `layout` is its
+    _grid_layout(), computed here when not supplied.
     Automatically detects grid boundaries using image brightness analysis.
     """
-    W, H = image.size
-    arr = np.array(image.convert("L"))
-    year = forced_year if forced_year else _detect_year(image)
-
-    # Detect horizontal separator between top row (months 1-6) and bottom row (7-12)
-    y_band = arr[int(H * 0.40): int(H * 0.60), int(W * 0.1): int(W * 0.9)]
-    mid_y = int(H * 0.40) + int(y_band.mean(axis=1).argmax())
+    H, W = gray.shape
+    threshold = _otsu_threshold(gray)
+    year = forced_year if forced_year else _detect_year(gray)
 
-    rows = [
-        (int(H * 0.130), max(int(H * 0.130) + 10, mid_y - int(H * 0.015))),
-        (min(mid_y + int(H * 0.010), int(H * 0.95)), int(H * 0.900)),
-    ]
-
-    all_events: List[dict] = []
-
-    for row_idx, (y0, y1) in enumerate(rows):
-        separators = _detect_col_separators(arr, y0, y1, W)
+    if layout is None:
+        layout = _grid_layout(gray)
+    bands = []
 
+    for y0, y1, separators in layout:
         if len(separators) == 5:
             xs = [int(W * 0.025)] + separators + [int(W * 0.975)]
         else:
@@ -359,20 +635,27 @@ def _extract_calendar_grid(image: Image.Image, forced_year: Optional[int] = None
             cw = (int(W * 0.975) - int(W * 0.025)) // 6
             xs = [int(W * 0.025) + i * cw for i in range(7)]
 
-        for col_idx in range(6):
-            month_num = row_idx * 6 + col_idx + 1
-            x0, x1 = xs[col_idx], xs[col_idx + 1]
-
-            crop = image.crop((x0, y0, x1, y1))
-            # 2× upscale improves OCR accuracy on small text
-            crop = crop.resize((crop.width * 2, crop.height * 2), Image.LANCZOS)
+        # Tesseract reads clean black-on-white input without re-binarizing;
+        # only the row band is thresholded, straight to uint8
+        band = (gray[y0:y1, xs[0]:xs[6]] > threshold).astype(np.uint8) * 255
+        bands.append((xs, Image.fromarray(band)))
 
-            try:
-                text = pytesseract.image_to_string(crop, lang="ron+eng")
-            except pytesseract.TesseractError:
-                text = pytesseract.image_to_string(crop, lang="eng")
+    # One word-level pass per row (layout analysis runs once for 6 months);
+    # tesseract runs outside the GIL, so both rows OCR in parallel
+    futures = [_OCR_POOL.submit(_ocr_words, band) for _, band in bands]
 
-            all_events.extend(_parse_month_text(text, month_num, year))
+    all_events: List[dict] = []
+    for row_idx, ((xs, _), future) in enumerate(zip(bands, futures)):
+        cells: List[list] = [[] for _ in range(6)]
+        for key, left, top, width, text in future.result():
+            # Assign each word to the month column containing its centre
+            x = xs[0] + left + width // 2
+            col_idx = min(max(bisect_right(xs, x) - 1, 0), 5)
+            cells[col_idx].append((key, left, top, text))
+
+        for col_idx, words in enumerate(cells):
+            month_num = row_idx * 6 + col_idx + 1
+            all_events.extend(_parse_month_text(_join_words(words), month_num, year))
 
     return all_events
 
@@ -387,12 +670,19 @@ def _generate_ics(event: dict) -> str:
     end = (event.get("end_date") or event.get("date") or "").replace("-", "") or start
 
     def fold(line: str) -> str:
-        out, chunk = [], line
-        while len(chunk.encode()) > 75:
-            out.append(chunk[:75])
-            chunk = " " + chunk[75:]
-        out.append(chunk)
-        return "\r\n".join(out)
+        # RFC 5545: at most 75 octets per line, never splitting a UTF-8 sequence;
+        # continuation lines spend one of those octets on the leading space
+        b = line.encode("utf-8")
+        if len(b) <= 75:
+            return line
+        parts, i, limit = [], 0, 75
+        while i < len(b):
+            j = min(i + limit, len(b))
+            while j < len(b) and (b[j] & 0xC0) == 0x80:
+                j -= 1
+            parts.append(b[i:j].decode("utf-8"))
+            i, limit = j, 74
+        return "\r\n ".join(parts)
 
     lines = [
         "BEGIN:VCALENDAR",